@@ -55,6 +55,7 @@ class NRF24L01:
         assert payload_size <= 32
 
         self.buf = bytearray(1)
+        self.buf2 = bytearray(2)
 
         # store the pins
         self.spi = spi
@@ -109,11 +110,15 @@ class NRF24L01:
             self.spi.init(master, baudrate=baudrate, polarity=0, phase=0)
 
     def reg_read(self, reg):
+        # a single 2-byte transfer, reusing the preallocated buffer so that
+        # polling a register does not allocate on the heap
+        buf = self.buf2
+        buf[0] = reg
+        buf[1] = 0
         self.cs(0)
-        self.spi.readinto(self.buf, reg)
-        self.spi.readinto(self.buf)
+        self.spi.write_readinto(buf, buf)
         self.cs(1)
-        return self.buf[0]
+        return buf[1]
 
     def reg_write_bytes(self, reg, buf):
         self.cs(0)
@@ -123,12 +128,15 @@ class NRF24L01:
         return self.buf[0]
 
     def reg_write(self, reg, value):
+        # do the command and data as a single 2-byte transfer, with CS held
+        # low for the whole frame
+        buf = self.buf2
+        buf[0] = 0x20 | reg
+        buf[1] = value
         self.cs(0)
-        self.spi.readinto(self.buf, 0x20 | reg)
-        ret = self.buf[0]
-        self.spi.readinto(self.buf, value)
+        self.spi.write_readinto(buf, buf)
         self.cs(1)
-        return ret
+        return buf[0]
 
     def flush_rx(self):
         self.cs(0)
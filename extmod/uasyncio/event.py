@@ -14,8 +14,10 @@ class Event:
 
     def set(self):
         # Event becomes set, schedule any tasks waiting on it
-        while self.waiting.peek():
-            core._task_queue.push_head(self.waiting.pop_head())
+        waiting = self.waiting
+        push = core._task_queue.push_head
+        while waiting.peek():
+            push(waiting.pop_head())
         self.state = True
 
     def clear(self):
@@ -24,8 +26,10 @@ class Event:
     async def wait(self):
         if not self.state:
             # Event not set, put the calling task on the event's waiting queue
-            self.waiting.push_head(core.cur_task)
+            waiting = self.waiting
+            cur_task = core.cur_task
+            waiting.push_head(cur_task)
             # Set calling task's data to the event's queue so it can be removed if needed
-            core.cur_task.data = self.waiting
+            cur_task.data = waiting
             yield
         return True
@@ -25,8 +25,17 @@ class NeoPixel:
         return tuple(self.buf[offset + self.ORDER[i]] for i in range(self.bpp))
 
     def fill(self, color):
-        for i in range(self.n):
-            self[i] = color
+        # set every pixel to the given colour, filling the buffer one
+        # colour-component at a time to avoid the per-pixel method calls
+        b = self.buf
+        l = len(b)
+        bpp = self.bpp
+        for i in range(bpp):
+            c = color[i]
+            j = self.ORDER[i]
+            while j < l:
+                b[j] = c
+                j += bpp
 
     def write(self):
         neopixel_write(self.pin, self.buf, self.timing)
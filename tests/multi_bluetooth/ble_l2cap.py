@@ -28,6 +28,11 @@ _NUM_PAYLOADS = const(16)
 
 _RANDOM_SEED = 22
 
+# Shared payload buffer, allocated once and reused by both the send and
+# recv paths below.
+payload_buf = bytearray(_PAYLOAD_LEN)
+payload_mv = memoryview(payload_buf)
+
 
 waiting_events = {}
 
@@ -75,19 +80,18 @@ def wait_for_event(event, timeout_ms):
 
 
 def send_data(ble, conn_handle, cid):
-    buf = bytearray(_PAYLOAD_LEN)
-    mv = memoryview(buf)
+    buf = payload_buf
     print("l2cap_send", _NUM_PAYLOADS, _PAYLOAD_LEN)
     for i in range(_NUM_PAYLOADS):
         n = _PAYLOAD_LEN + i * _PAYLOAD_LEN_STEP
         for j in range(n):
             buf[j] = random.randint(0, 255)
-        if not ble.l2cap_send(conn_handle, cid, mv[:n]):
+        if not ble.l2cap_send(conn_handle, cid, payload_mv[:n]):
             wait_for_event(_IRQ_L2CAP_SEND_READY, TIMEOUT_MS)
 
 
 def recv_data(ble, conn_handle, cid):
-    buf = bytearray(_PAYLOAD_LEN)
+    buf = payload_buf
     recv_bytes = 0
     recv_correct = 0
     expected_bytes = (
@@ -26,7 +26,7 @@
 # THE SOFTWARE.
 
 import argparse
-import glob
+import fnmatch
 import itertools
 import os
 import re
@@ -79,12 +79,68 @@ C_EXTS = (
 PY_EXTS = (".py",)
 
 
+def path_pattern_to_regex(pattern):
+    # Convert a glob pattern to a regex with the same semantics as
+    # glob.glob(recursive=True): * and ? match within a single path component
+    # and not a leading dot, ** matches any number of components.
+    regex = []
+    i = 0
+    while i < len(pattern):
+        c = pattern[i]
+        if pattern[i : i + 3] == "**/":
+            regex.append(r"(?:[^/.][^/]*/)*")
+            i += 3
+        elif c in "*?":
+            if i == 0 or pattern[i - 1] == "/":
+                regex.append(r"(?!\.)")
+            regex.append(r"[^/]*" if c == "*" else r"[^/]")
+            i += 1
+        elif c == "[":
+            j = pattern.index("]", i)
+            regex.append(pattern[i : j + 1])
+            i = j + 1
+        else:
+            regex.append(re.escape(c))
+            i += 1
+    return re.compile("".join(regex) + "$")
+
+
 def list_files(paths, exclusions=None, prefix=""):
-    files = set()
-    for pattern in paths:
-        files.update(glob.glob(os.path.join(prefix, pattern), recursive=True))
-    for pattern in exclusions or []:
-        files.difference_update(glob.fnmatch.filter(files, os.path.join(prefix, pattern)))
+    matchers = [path_pattern_to_regex(pattern) for pattern in paths]
+    # Exclusions keep their original fnmatch semantics, where * also matches
+    # path separators.
+    exclusion_matchers = [
+        re.compile(fnmatch.translate(os.path.join(prefix, pattern)))
+        for pattern in exclusions or []
+    ]
+    # Directory subtrees matching an exclusion pattern that ends in * (e.g.
+    # the ports/*/build* output directories) can be pruned from the walk
+    # entirely, because such a pattern also matches everything below the
+    # directory.
+    prune_matchers = [
+        matcher
+        for pattern, matcher in zip(exclusions or [], exclusion_matchers)
+        if pattern.endswith("*")
+    ]
+    files = []
+    top = prefix or "."
+    # A single walk of the tree replaces one full traversal per glob pattern.
+    for dirpath, dirnames, filenames in os.walk(top):
+        rel_dir = os.path.relpath(dirpath, top)
+        if rel_dir == ".":
+            rel_dir = ""
+        dirnames[:] = [
+            d
+            for d in dirnames
+            if not d.startswith(".")
+            and not any(m.match(os.path.join(prefix, rel_dir, d)) for m in prune_matchers)
+        ]
+        for name in filenames:
+            rel = os.path.join(rel_dir, name).replace(os.sep, "/")
+            if any(m.match(rel) for m in matchers):
+                file = os.path.join(prefix, rel)
+                if not any(m.match(file) for m in exclusion_matchers):
+                    files.append(file)
     return sorted(files)
 
 